@@ -93,6 +93,7 @@ class Page(Element):
         self._has_default_next_page = True
         self.index = None
         self.elements = []
+        self._action_elements: List[ActionChoiceInput] = []  # used in next_page
         self._unvalidated_elements: Set[InputElement] = set()
         self._validation_state_hook: Optional[Callable[[Page], None]] = None
         self._path_invalidation_hook: Optional[Callable[[Page], None]] = None
@@ -126,6 +127,8 @@ class Page(Element):
 
     def append(self, elem: Element):
         self.elements.append(elem)
+        if isinstance(elem, ActionChoiceInput):
+            self._action_elements.append(elem)
         if isinstance(elem, InputElement):
             elem.set_hook(self._update_validation_state)
             if not elem.is_validated:
@@ -141,34 +144,29 @@ class Page(Element):
             return None
 
         next_page = self._next_page
-        for elem in self.elements:
-            if isinstance(elem, ActionChoiceInput) and elem.next_page is not None:
+        for elem in self._action_elements:
+            if elem.next_page is not None:
                 next_page = elem.next_page
         return next_page
 
     def to_str(self, indent=0, include_answer=False):
         """See base class."""
-        title = f'Page {self.index + 1}:'
+        title = [f'Page {self.index + 1}:']
         if self.name:
-            title = f'{title} {self.name}'
+            title.append(f' {self.name}')
         if not self._has_default_next_page:
             if self._next_page is None:
-                title = f'{title} -> Submit'
+                title.append(' -> Submit')
             else:
-                title = f'{title} -> Page {self._next_page.index + 1}'
+                title.append(f' -> Page {self._next_page.index + 1}')
         if self.description:
-            title = f'{title}\n{self.description}'
-        if not self.elements:
-            return title
+            title.append(f'\n{self.description}')
+        lines = [''.join(title)]
         separator = elem_separator(indent)
-        return '\n'.join(
-            [title] +
-            [
-                separator + '\n' +
-                add_indent(elem.to_str(indent=indent, include_answer=include_answer), indent)
-                for elem in self.elements
-            ]
-        )
+        for elem in self.elements:
+            lines.append(separator)
+            lines.append(add_indent(elem.to_str(indent=indent, include_answer=include_answer), indent))
+        return '\n'.join(lines)
 
     def payload(self) -> Dict[str, List[str]]:
         """Returns a combined payload of all elements from this page."""
@@ -707,28 +705,7 @@ def _cb_validated_choices(elem: Checkboxes):
         return random.sample(elem.options, required_cnt)
 
 
-def _validated_choices(elem):
-    if isinstance(elem, Grid):
-        return _grid_validated_choices(elem)
-    if isinstance(elem, Checkboxes):
-        return _cb_validated_choices(elem)
-    raise NotImplementedError()
-
-
-def default_callback(elem: InputElement, page_index, elem_index) -> Union[ElemValue, EmptyValue]:
-    """The default callback implementation for Form.fill.
-
-    This callback will raise a NotImplementedError
-    if it is called on a TextInput, DateInput or a TimeInput.call
-    """
-
-    # Single choice inputs
-    if isinstance(elem, Scale) or isinstance(elem, Dropdown) or isinstance(elem, Radio):
-        opts = elem.options[:]
-        if not elem.required:
-            opts.append(Value.EMPTY)
-        return random.choice(opts)
-
+def _random_single_choice(elem: ChoiceInput1D):
     # Example: allow "Other" in Radio
     #     if elem.other_option is not None:
     #         opt = random.choice(elem.options + [elem.other_option])
@@ -736,57 +713,98 @@ def default_callback(elem: InputElement, page_index, elem_index) -> Union[ElemVa
     #             # return 'Sample text'  # another alternative
     #             opt.value = 'Sample text'
     #         return opt
+    opts = elem.options[:]
+    if not elem.required:
+        opts.append(Value.EMPTY)
+    return random.choice(opts)
+
+
+def _check_validator(elem: ValidatedInput):
+    """Raises an exception if random values cannot be chosen for a validated element."""
+    if elem.is_misconfigured():
+        raise MisconfiguredElement(elem)
+    if elem.validator.has_unknown_type():
+        # Raise, not warn. Otherwise, most probably, form submission will fail
+        # If needed, custom callback should handle such cases
+        raise UnknownValidator(
+            type(elem.validator), [elem.validator.type, elem.validator.subtype]
+        )
+    if elem.validator.bad_args:
+        raise InvalidArguments(
+            type(elem.validator), elem.validator.type,
+            elem.validator.subtype, elem.validator.args
+        )
 
-    # Check the validator; for TextInput raise NotImplementedError (later)
-    if isinstance(elem, ValidatedInput) and not isinstance(elem, TextInput) \
-            and elem.validator is not None:
-
-        if elem.is_misconfigured():
-            raise MisconfiguredElement(elem)
-        if elem.validator.has_unknown_type():
-            # Raise, not warn. Otherwise, most probably, form submission will fail
-            # If needed, custom callback should handle such cases
-            raise UnknownValidator(
-                type(elem.validator), [elem.validator.type, elem.validator.subtype]
-            )
-        if elem.validator.bad_args:
-            raise InvalidArguments(
-                type(elem.validator), elem.validator.type,
-                elem.validator.subtype, elem.validator.args
-            )
-        return _validated_choices(elem)
-
-    if isinstance(elem, Checkboxes):
-        # Don't auto-choose "Other"
-        return random_subset(elem.options, min_size=int(elem.required))
-
-    if isinstance(elem, Grid):
-        n = len(elem.rows)
-        if isinstance(elem, CheckboxGrid):
-            return [random_subset(elem.options, min_size=int(elem.required)) for _ in range(n)]
-        opts = elem.options
-        if not elem.required:
-            opts = opts + [Value.EMPTY]
-        return [random.choice(opts) for _ in range(n)]
 
-    # text inputs / Date / DateTime / Time / Duration
-    raise NotImplementedError(f'Cannot choose a random value for {elem._type_str()}')
+def _random_checkboxes(elem: Checkboxes):
+    if elem.validator is not None:
+        _check_validator(elem)
+        return _cb_validated_choices(elem)
+    # Don't auto-choose "Other"
+    return random_subset(elem.options, min_size=int(elem.required))
+
+
+def _random_radio_grid(elem: RadioGrid):
+    if elem.validator is not None:
+        _check_validator(elem)
+        return _grid_validated_choices(elem)
+    opts = elem.options
+    if not elem.required:
+        opts = opts + [Value.EMPTY]
+    return [random.choice(opts) for _ in range(len(elem.rows))]
+
+
+def _random_checkbox_grid(elem: CheckboxGrid):
+    if elem.validator is not None:
+        _check_validator(elem)
+        return _grid_validated_choices(elem)
+    return [random_subset(elem.options, min_size=int(elem.required)) for _ in elem.rows]
+
+
+# Keyed by element class, subclasses resolve to their nearest listed base (see default_callback)
+_default_fillers = {
+    Scale: _random_single_choice,
+    Dropdown: _random_single_choice,
+    Radio: _random_single_choice,
+    Checkboxes: _random_checkboxes,
+    RadioGrid: _random_radio_grid,
+    CheckboxGrid: _random_checkbox_grid,
+}
 
 
-_element_mapping = {getattr(Element.Type, el_type.__name__.upper()): el_type for el_type in [
-    Unknown,
+def default_callback(elem: InputElement, page_index, elem_index) -> Union[ElemValue, EmptyValue]:
+    """The default callback implementation for Form.fill.
+
+    This callback will raise a NotImplementedError
+    if it is called on a TextInput, DateInput or a TimeInput.call
+    """
+    # Walk the MRO, so that subclasses of the supported elements use their parent's filler
+    fill = next((_default_fillers[cls] for cls in type(elem).__mro__ if cls in _default_fillers), None)
+    if fill is None:
+        # text inputs / Date / DateTime / Time / Duration
+        raise NotImplementedError(f'Cannot choose a random value for {elem._type_str()}')
+    return fill(elem)
+
+
+# Keyed by the raw type value, so that parse() doesn't need an enum lookup
+_element_mapping = {getattr(Element.Type, el_type.__name__.upper()).value: el_type for el_type in [
     Page,
     Short, Paragraph,
     Radio, Dropdown, Checkboxes, Scale,
     Comment, Page, Image, Video,
 ]}
 
-_element_mapping[Element.Type.FILE_UPLOAD] = FileUpload
+_element_mapping[Element.Type.FILE_UPLOAD.value] = FileUpload
 
 
 def parse(elem):
     """Creates an Element of the right type from its JSON representation."""
-    el_type = Element.Type(elem[Element._Index.TYPE])
+    raw_type = elem[Element._Index.TYPE]
+    cls = _element_mapping.get(raw_type)
+    if cls is not None:
+        return cls.parse(elem)
+
+    el_type = Element.Type(raw_type)
     if el_type is Element.Type.GRID:
         cls = CheckboxGrid if Grid.parse_multichoice(elem) else RadioGrid
     elif el_type is Element.Type.DATE:
@@ -794,7 +812,6 @@ def parse(elem):
     elif el_type is Element.Type.TIME:
         cls = Duration if TimeInput.parse_duration_flag(elem) else Time
     else:
-        cls = _element_mapping[el_type]
-    if el_type is Element.Type.UNKNOWN:
-        warn(UnknownElement(elem, elem[Element._Index.TYPE]))
+        cls = Unknown
+        warn(UnknownElement(elem, raw_type))
     return cls.parse(elem)
@@ -143,12 +143,12 @@ class Element:
 
         For args description, see Form.to_str.
         """
-        s = f'{self._type_str()}'
+        parts = [self._type_str()]
         if self.name:
-            s = f'{s}: {self.name}'
+            parts.append(f': {self.name}')
         if self.description:
-            s = f'{s}\n{self.description}'
-        return s
+            parts.append(f'\n{self.description}')
+        return ''.join(parts)
 
     def _type_str(self):
         return type(self).__name__
@@ -184,6 +184,7 @@ class InputElement(Element, ABC):
     def __init__(self, *, entry_ids, required, image=None, **kwargs):
         super().__init__(**kwargs)
         self._entry_ids = entry_ids
+        self._submit_ids = [self._submit_id(entry_id) for entry_id in entry_ids]
         self.required = required
         self.image = image
         self._values: List[List[str]] = [[] for _ in self._entry_ids]
@@ -263,9 +264,9 @@ class InputElement(Element, ABC):
         and can be used as a (part of) POST request body.
         """
         payload = {}
-        for entry_id, value in zip(self._entry_ids, self._values):
+        for submit_id, value in zip(self._submit_ids, self._values):
             if value:
-                payload[self._submit_id(entry_id)] = value[:]
+                payload[submit_id] = value[:]
         return payload
 
     def draft(self) -> List[Tuple]:
@@ -300,12 +301,11 @@ class InputElement(Element, ABC):
         return not any(self._values)
 
     def _set_values(self, values: List[Union[List[str], EmptyValue]]):
-        values = values[:]
-        for i, entry_values in enumerate(values):
-            if entry_values is Value.EMPTY:
-                values[i] = []
-
-        self._values = values  # type: ignore
+        # Build the new list in one pass (the argument is not modified)
+        self._values = [  # type: ignore
+            [] if entry_values is Value.EMPTY else entry_values
+            for entry_values in values
+        ]
         self.is_validated = False
 
     def _header(self, indent) -> List[str]:
@@ -363,7 +363,7 @@ class SingleInput(InputElement):
         return self._entry_ids[0]
 
     def _part_id(self, name):
-        return f'{self._submit_id(self._entry_id)}_{name}'
+        return f'{self._submit_ids[0]}_{name}'
 
     @staticmethod
     def _get_entry(elem):
@@ -394,23 +394,30 @@ class ChoiceInput(InputElement, ABC):
     def __init__(self, *, options: List[List[Option]], **kwargs):
         super().__init__(**kwargs)
         self._options = options
+        # value -> option for each entry. If values are duplicated, the first option is used
+        self._option_lookup = [
+            {opt.value: opt for opt in reversed(entry_options)}
+            for entry_options in options
+        ]
 
     @property
     @abstractmethod
     def options(self):
-        """A list of allowed choices for this element."""
+        """A list of allowed choices for this element.
+
+        The list must not be modified: values are matched against
+        the options which the element had when it was created.
+        """
         raise NotImplementedError()
 
     def _set_choices(self, choices: List[Union[List[ChoiceValue], EmptyValue]]):
-        new_choices: List[Union[List[str], EmptyValue]] = [[] for _ in choices]
+        new_choices: List[Union[List[str], EmptyValue]] = []
         for i, entry_choices in enumerate(choices):
-            if entry_choices is Value.EMPTY:
-                continue
-            for choice in cast(List[ChoiceValue], entry_choices):
-                self._add_choice(
-                    new_choices[i],
-                    self._find_option(choice, i)
-                )
+            entry_values: List[str] = []
+            if entry_choices is not Value.EMPTY:
+                for choice in cast(List[ChoiceValue], entry_choices):
+                    self._add_choice(entry_values, self._find_option(choice, i))
+            new_choices.append(entry_values)
         self._set_values(new_choices)
 
     def _find_option(self, value: ChoiceValue, i):
@@ -418,11 +425,10 @@ class ChoiceInput(InputElement, ABC):
             # assuming value was chosen from self.options
             return value
 
-        for opt in self._options[i]:
-            if opt.value == value:
-                return opt
-
-        raise InvalidChoice(self, value, index=i)
+        opt = self._option_lookup[i].get(value)
+        if opt is None:
+            raise InvalidChoice(self, value, index=i)
+        return opt
 
     def _add_choice(self, choices, choice: Option):
         choices.append(choice.value)
@@ -551,6 +557,7 @@ class OtherChoiceInput(ChoiceInput1D):
         super().__init__(**kwargs)
         self.other_option = other_option
         self._other_value: Union[str, None] = None
+        self._other_submit_id = self._submit_ids[0] + '.other_option_response'
 
     def payload(self) -> Dict[str, List[str]]:
         """See base class."""
@@ -559,10 +566,8 @@ class OtherChoiceInput(ChoiceInput1D):
         if not self._other_value:
             return payload
 
-        main_key = self._submit_id(self._entry_id)
-        other_key = main_key + '.other_option_response'
-        payload.setdefault(main_key, []).append('__other_option__')
-        payload[other_key] = [self._other_value]
+        payload.setdefault(self._submit_ids[0], []).append('__other_option__')
+        payload[self._other_submit_id] = [self._other_value]
         return payload
 
     def draft(self) -> List[Tuple]:
@@ -595,9 +600,9 @@ class OtherChoiceInput(ChoiceInput1D):
                 raise DuplicateOther(self, self._other_value, value.value)
             return value
 
-        for opt in self.options:
-            if opt.value == value:
-                return opt
+        opt = self._option_lookup[0].get(value)
+        if opt is not None:
+            return opt
 
         if self._other_value is not None:
             raise DuplicateOther(self, self._other_value, value)
@@ -697,7 +702,7 @@ class Grid(ValidatedInput, ChoiceInput):
 
     Attributes:
         rows: The grid row names.
-        cols: The grid columns (an alias for options).
+        cols: The grid columns (an alias for options, must not be modified).
         shuffle_rows: Shuffle this grid's rows.
     """
 
@@ -1,3 +1,4 @@
+import html
 import json
 import re
 import sys
@@ -9,6 +10,11 @@ import requests
 from requests.status_codes import codes
 from bs4 import BeautifulSoup
 
+try:
+    import orjson
+except ImportError:  # optional, used only to decode the form data
+    orjson = None
+
 from .elements_base import ImageChoiceInput, InputElement
 from .elements import _Action, Image, Page, UserEmail, Value, \
                       parse as parse_element
@@ -26,6 +32,20 @@ from .util import add_indent, deprecated, list_get, page_separator
 CallbackType = Callable[[InputElement, int, int], CallbackRetVal]
 
 
+# Hidden inputs and form data are extracted without building a DOM.
+# Comments and raw text elements (<script>, <style>) are matched as a whole,
+# so that tags inside them are not mistaken for inputs.
+_HTML_TOKEN_REGEX = re.compile(
+    r'''<!--.*?(?:-->|\Z)'''
+    r'''|<(?P<raw_tag>script|style)\b(?:[^>"']|"[^"]*"|'[^']*')*>(?P<raw_text>.*?)(?:</(?P=raw_tag)\s*>|\Z)'''
+    r'''|(?P<input><input\b(?:[^>"']|"[^"]*"|'[^']*')*>)''',
+    re.I | re.S
+)
+_ATTRIBUTE_REGEX = re.compile(r'''([^\s"'>/=]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))''')
+_FORM_DATA_REGEX = re.compile(r'FB_PUBLIC_LOAD_DATA_\s*=\s*(?=\[)')
+_VIEWFORM_PATH_REGEX = re.compile(r'viewform.*?$')
+
+
 class _ElementNames:
     FBZX = 'fbzx'
     DRAFT = 'partialResponse'
@@ -244,6 +264,7 @@ class Form:
 
     _prefilled_data: Dict[str, List[str]]
     _first_page: Optional[requests.models.Response]
+    _submit_url: Optional[str]
     _fbzx: Optional[str]  # Doesn't need to be unique
     _history: Optional[str]
     _draft: Optional[str]
@@ -274,7 +295,8 @@ class Form:
                 or "https://forms.gle/...".
                 Pre-filled links and response editing are also supported.
             session: A session which is used to load the form.
-                If session is None, requests.get is used.
+                If session is None, a temporary session is used,
+                so that connections are reused between requests.
             resolve_images: If true, image URLs will be parsed.
                 Slows down loading of multipage forms.
 
@@ -290,7 +312,8 @@ class Form:
                 (most probably, it contains a file upload element).
         """
         if session is None:
-            session = requests
+            with requests.Session() as session:
+                return self.load(url, session, resolve_images)
 
         self._clear()  # TODO make atomic? If load/reload fails, form should keep old data
 
@@ -300,20 +323,23 @@ class Form:
         self._check_resp(self._first_page)
         prefilled_data, is_edit = self._parse_url(self._first_page.url)
         self._prefilled_data = prefilled_data
+        self._submit_url = self._response_url(self._first_page.url)
 
-        soup = BeautifulSoup(self._first_page.text, 'html.parser')
+        page_html = self._first_page.text
 
-        data = self._raw_form(soup)
-        self._fbzx = self._get_fbzx(soup)
-        self._history = self._get_history(soup)
-        self._draft = self._get_draft(soup)
+        data, inputs = self._scan_page(
+            page_html, (_ElementNames.FBZX, _ElementNames.HISTORY, _ElementNames.DRAFT)
+        )
+        self._fbzx = inputs.get(_ElementNames.FBZX)
+        self._history = inputs.get(_ElementNames.HISTORY)
+        self._draft = inputs.get(_ElementNames.DRAFT)
         if data is None or any(value is None for value in [self._fbzx, self._history, self._draft]):
             raise ParseError(self)
 
         if is_edit:
             self._prefilled_data = self._prefill_from_draft(self._draft)
 
-        self._parse(data, resolve_images, session, soup)
+        self._parse(data, resolve_images, session, page_html)
         self.is_loaded = True
 
     def to_str(self, indent=0, include_answer=False):
@@ -495,7 +521,13 @@ class Form:
             raise SigninRequired(self)
 
         if session is None:
-            session = requests
+            with requests.Session() as session:
+                return self.submit(
+                    session,
+                    need_receipt=need_receipt,
+                    captcha_handler=captcha_handler,
+                    emulate_history=emulate_history
+                )
 
         if emulate_history:
             last_response, page, history, draft = self._emulate_history(session, need_receipt)
@@ -519,11 +551,14 @@ class Form:
             last_response = self._submit_page(session, page, history, draft,
                                               continue_=next_page is not None,
                                               captcha_response=captcha_response)
-            soup = BeautifulSoup(last_response.text, 'html.parser')
-            history = self._get_history(soup)
-            draft = self._get_draft(soup)
+            text = last_response.text
+            _, inputs = self._scan_page(
+                text, (_ElementNames.HISTORY, _ElementNames.DRAFT), find_form_data=False
+            )
+            history = inputs.get(_ElementNames.HISTORY)
+            draft = inputs.get(_ElementNames.DRAFT)
             if next_page is None and history is None:
-                return SubmissionResult(soup)
+                return SubmissionResult(BeautifulSoup(text, 'html.parser'))
             if next_page is None or history is None or \
                     next_page.index != int(history.rsplit(',', 1)[-1]):
                 raise RuntimeError('Incorrect next page', self, last_response, next_page)
@@ -541,6 +576,7 @@ class Form:
 
         self._prefilled_data = {}
         self._first_page = None
+        self._submit_url = None
 
         self._selected_pages = set()
         self._unvalidated_pages = set()
@@ -589,7 +625,7 @@ class Form:
     @staticmethod
     def _response_url(url: str):
         url_data = list(urlsplit(url))
-        url_data[2] = re.sub(r'viewform.*?$', 'formResponse', url_data[2])  # path
+        url_data[2] = _VIEWFORM_PATH_REGEX.sub('formResponse', url_data[2])  # path
         original_query = parse_qs(url_data[3])
         query = {}
         # If 'edit2' is removed, it is possible to edit a response when editing is restricted.
@@ -631,11 +667,10 @@ class Form:
             if not curr_page_images:
                 return
             if len(self.pages) == 1:
-                soup = first_page_html
+                page_html = first_page_html
             else:
-                resp = self._fetch_page(session, self.pages[-1])
-                soup = BeautifulSoup(resp.text, 'html.parser')
-            self._resolve_images(curr_page_images, soup)
+                page_html = self._fetch_page(session, self.pages[-1]).text
+            self._resolve_images(curr_page_images, BeautifulSoup(page_html, 'html.parser'))
             if curr_page_images:
                 print(f'Failed to get URLs for some images on page {len(self.pages)}', file=sys.stderr)
                 curr_page_images.clear()
@@ -859,8 +894,7 @@ class Form:
         if back:
             payload['back'] = 1
 
-        url = self._response_url(self._first_page.url)
-        response = session.post(url, data=payload)
+        response = session.post(self._submit_url, data=payload)
         self._check_resp(response)
         if response.status_code != 200:
             raise RuntimeError('Invalid response code', response)
@@ -883,9 +917,8 @@ class Form:
         draft = json.loads(draft)
         if draft[0] is None:
             return {}
-        prefilled_data = {}
-        for entry in draft[0]:
-            prefilled_data[entry[1]] = entry[2]  # Use an index class for draft?
+        # Use an index class for draft?
+        prefilled_data = {entry[1]: entry[2] for entry in draft[0]}
         email = list_get(draft, 6, None)
         if email is not None:
             prefilled_data[UserEmail.ENTRY_ID] = [email]
@@ -900,32 +933,58 @@ class Form:
         return page.url.endswith('editingdisabled')
 
     @staticmethod
-    def _get_input(soup, name):
-        elem = soup.find('input', {'name': name})
-        if elem is None:
-            return None
-        return elem['value']
+    def _scan_page(page_html, input_names, find_form_data=True):
+        """Extracts hidden inputs and the form data from a page in a single pass.
 
-    @staticmethod
-    def _get_fbzx(soup):
-        return Form._get_input(soup, _ElementNames.FBZX)
+        Returns the form data (None if it wasn't found or wasn't requested)
+        and a dict with the values of the first <input>s with the given names.
+        """
+        data = None
+        inputs = {}
+        for token in _HTML_TOKEN_REGEX.finditer(page_html):
+            tag = token.group('input')
+            if tag is not None:
+                attrs = {
+                    match.group(1).lower(): match.group(match.lastindex)
+                    for match in _ATTRIBUTE_REGEX.finditer(tag, len('<input'))
+                }
+                name = attrs.get('name')
+                if name in input_names and name not in inputs:
+                    value = attrs.get('value')
+                    inputs[name] = html.unescape(value) if value is not None else None
+            elif find_form_data and (token.group('raw_tag') or '').lower() == 'script':
+                script = token.group('raw_text')
+                match = _FORM_DATA_REGEX.search(script)
+                if match is not None:
+                    data = Form._decode_form_data(script, match.end())
+                    find_form_data = False
+            if not find_form_data and len(inputs) == len(input_names):
+                break
+        return data, inputs
 
     @staticmethod
-    def _get_history(soup):
-        return Form._get_input(soup, _ElementNames.HISTORY)
+    def _get_input(page_html, name):
+        """Returns the value of the first <input> with the given name."""
+        return Form._scan_page(page_html, (name,), find_form_data=False)[1].get(name)
 
     @staticmethod
-    def _get_draft(soup):
-        return Form._get_input(soup, _ElementNames.DRAFT)
+    def _raw_form(page_html):
+        return Form._scan_page(page_html, ())[0]
 
     @staticmethod
-    def _raw_form(soup):
-        scripts = soup.find_all('script')
-        pattern = re.compile(r'FB_PUBLIC_LOAD_DATA_\s*=\s*(\[.+\])\s*;', re.S)
-        for script in scripts:
-            if script.string is None:
-                continue
-            match = pattern.search(script.string)
-            if match:
-                return json.loads(match.group(1))
-        return None
+    def _decode_form_data(script, start):
+        """Decodes the JSON array which starts at script[start].
+
+        orjson is used if it is installed. Unlike json, it decodes integers
+        which don't fit into 64 bits as floats (the form data doesn't contain such numbers)
+        and rejects unpaired surrogates in strings. Data rejected by orjson is decoded with json.
+        """
+        if orjson is not None:
+            # Usually the data is the only statement in the script
+            data = script[start:].rstrip()
+            if data.endswith(';'):
+                try:
+                    return orjson.loads(data[:-1])
+                except orjson.JSONDecodeError:
+                    pass  # Other JS after the data or a string not supported by orjson
+        return json.JSONDecoder().raw_decode(script, start)[0]
@@ -14,8 +14,14 @@ class Option:
     Attributes:
         value: The option's value.
         other: Whether or not this option is the "Other" option.
+        image: An image attached to the option (may be None).
+
+    Options define __slots__, so other attributes cannot be set on them
+    and pickling them requires protocol 2 or higher.
     """
 
+    __slots__ = ('value', 'other', 'image', '__weakref__')
+
     class _Index:
         VALUE = 0
         ACTION = 2
@@ -66,6 +72,8 @@ class ActionOption(Option):
         next_page: The next page for this option.
     """
 
+    __slots__ = ('_action', 'next_page')
+
     @classmethod
     def _parse(cls, option):
         res = super()._parse(option)
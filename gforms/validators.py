@@ -1,22 +1,44 @@
+import operator
 import re
 from abc import ABC, abstractmethod
-from collections import Counter
-from typing import TYPE_CHECKING, List, cast
+from functools import lru_cache
+from typing import List
 from warnings import warn
 
+try:
+    import regex
+except ImportError:  # optional, used only for regex validators
+    regex = None
+
 from .errors import SameColumn, UnknownValidator, InvalidText, InvalidArguments, InvalidChoiceCount
 from .util import EMAIL_REGEX, URL_REGEX, DefaultEnum, ArgEnum, list_get
 
-if TYPE_CHECKING:
-    from .elements import Checkboxes
+
+_email_match = EMAIL_REGEX.match
+_url_match = URL_REGEX.match
+
+
+@lru_cache(maxsize=512)
+def _compile_regex(pattern):
+    """Compiles a pattern for a regex validator.
+
+    If the regex module is installed, it is used instead of re.
+    Patterns which are not supported by regex are compiled with re.
+    Compiled patterns are cached and shared between validators.
+    """
+    if regex is not None:
+        try:
+            return regex.compile(pattern)
+        except regex.error:
+            pass
+    return re.compile(pattern)
 
 
 class Subtype(DefaultEnum, ArgEnum):
     # Add UNKNOWN dynamically?
 
-    @property
-    def argnum(self):
-        return self.arg[0]
+    def __init__(self, value, arg):
+        self.argnum = arg[0]
 
     def descr(self, args):
         if args is None:
@@ -36,12 +58,13 @@ class Validator(ABC):
             indicating if the arguments could not be parsed correctly.
     """
 
+    __slots__ = ('type', 'subtype', 'args', 'error_msg', 'bad_args')
+
     class Type(DefaultEnum, ArgEnum):
         # Add UNKNOWN dynamically?
 
-        @property
-        def subtype_class(self):
-            return self.arg
+        def __init__(self, value, arg):
+            self.subtype_class = arg
 
     class _Index:
         TYPE = 0
@@ -169,6 +192,97 @@ class RegexTypes(Subtype):
         return self.arg[1].format(*(arg.pattern for arg in args))
 
 
+def _is_int(val, args):
+    try:
+        _ = int(val)
+        return True
+    except ValueError:
+        return False
+
+
+def _number_check(compare):
+    """Converts a number comparison into a check for a string value."""
+    def check(val, args):
+        try:
+            val = float(val)
+        except ValueError:
+            return False
+        return compare(val, args)
+    return check
+
+
+# Checks for TextValidator, the signature is check(value, args) -> is_ok
+_text_checks = {
+    NumberTypes.GT: _number_check(lambda val, args: val > args[0]),
+    NumberTypes.GE: _number_check(lambda val, args: val >= args[0]),
+    NumberTypes.LT: _number_check(lambda val, args: val < args[0]),
+    NumberTypes.LE: _number_check(lambda val, args: val <= args[0]),
+    # if arg == 2.0, "1.99..9" will pass validation.
+    # It's ok, as long as the value is accepted by server
+    NumberTypes.EQ: _number_check(lambda val, args: val == args[0]),
+    NumberTypes.NE: _number_check(lambda val, args: val != args[0]),
+    # The first arg can be greater than the second. This is checked in TextInput.
+    NumberTypes.RANGE: _number_check(lambda val, args: args[0] <= val <= args[1]),
+    # The first arg can be greater than the second, it's ok
+    NumberTypes.NOT_RANGE: _number_check(lambda val, args: val < min(args) or val > max(args)),
+    # NOTE will return True for "NaN", "Inf" and "Infinity".
+    # JS validator accepts only the last one.
+    # It was not tested if these values pass the server-side validation
+    NumberTypes.IS_NUMBER: _number_check(lambda val, args: True),
+    NumberTypes.IS_INT: _is_int,
+
+    TextTypes.CONTAINS: lambda val, args: args[0] in val,
+    TextTypes.NOT_CONTAINS: lambda val, args: args[0] not in val,
+    TextTypes.EMAIL: lambda val, args: _email_match(val) is not None,
+    # couldn't find a regex / checking algorithm in page source
+    # It seems that URLS are validaetd on the server side
+    # (client performs only basic checks)
+    TextTypes.URL: lambda val, args: _url_match(val) is not None,
+
+    LengthTypes.MIN_LENGTH: lambda val, args: len(val) >= args[0],
+    LengthTypes.MAX_LENGTH: lambda val, args: len(val) <= args[0],
+
+    RegexTypes.CONTAINS: lambda val, args: args[0].search(val) is not None,
+    RegexTypes.NOT_CONTAINS: lambda val, args: args[0].search(val) is None,
+    RegexTypes.MATCHES: lambda val, args: args[0].match(val) is not None,
+    RegexTypes.NOT_MATCHES: lambda val, args: args[0].match(val) is None,
+}
+
+
+def _parse_text_args(args):
+    return args, True  # only string args
+
+
+def _parse_length_args(args):
+    try:
+        return [int(arg) for arg in args], True
+    except ValueError:
+        return args, False
+
+
+def _parse_number(arg):
+    if isinstance(arg, str) and arg.lstrip('-').isdecimal():
+        return int(arg)  # an integer, no need to parse a float
+    arg = float(arg)
+    if arg.is_integer():
+        return int(arg)
+    return arg
+
+
+def _parse_number_args(args):
+    try:
+        return [_parse_number(arg) for arg in args], True
+    except ValueError:
+        return args, False
+
+
+def _parse_regex_args(args):
+    try:
+        return [_compile_regex(arg) for arg in args], True
+    except re.error:
+        return args, False
+
+
 class TextValidator(Validator):
     class Type(Validator.Type):
         UNKNOWN = (-1, None)
@@ -177,29 +291,11 @@ class TextValidator(Validator):
         REGEX = (4, RegexTypes)
         LENGTH = (6, LengthTypes)
 
+    __slots__ = ()
+
     @classmethod
     def _parse_arg_list(cls, args, type_, subtype):
-        if type_ is cls.Type.TEXT:
-            return args, True  # only string args
-        if type_ is cls.Type.LENGTH:
-            try:
-                return [int(arg) for arg in args], True
-            except ValueError:
-                return args, False
-        if type_ is cls.Type.NUMBER:
-            try:
-                args = [float(arg) for arg in args]
-                for i in range(len(args)):
-                    if args[i].is_integer():
-                        args[i] = int(args[i])
-                return args, True
-            except ValueError:
-                return args, False
-        if type_ is cls.Type.REGEX:
-            try:
-                return [re.compile(arg) for arg in args], True
-            except re.error:
-                return args, False
+        return _text_arg_parsers[type_](args)
 
     def _descr(self):
         return 'Allowed values: ' + super()._descr()
@@ -207,94 +303,24 @@ class TextValidator(Validator):
     def _validate(self, elem, values: List[List[str]]):
         if not values[0]:  # empty element
             return
-        value = values[0][0]
-        if self.type is self.Type.NUMBER:
-            is_ok = self._validate_number(value)
-        elif self.type is self.Type.TEXT:
-            is_ok = self._validate_text(value)
-        elif self.type is self.Type.LENGTH:
-            is_ok = self._validate_length(value)
-        elif self.type is self.Type.REGEX:
-            is_ok = self._validate_regex(value)
-        else:
+        # The check is looked up here (not stored on the instance) to keep validators picklable
+        check = _text_checks.get(self.subtype)
+        if check is None:
             raise NotImplementedError()
-        if not is_ok:
+        value = values[0][0]
+        if not check(value, self.args):
             descr = self._descr()
             if self.error_msg:
                 descr = f'{self.error_msg} ({descr})'
             raise InvalidText(elem, value, details=descr)
 
-    def _validate_number(self, val):
-        if self.subtype is NumberTypes.IS_INT:
-            try:
-                _ = int(val)
-                return True
-            except ValueError:
-                return False
-        try:
-            val = float(val)
-        except ValueError:
-            return False
-
-        if self.subtype is NumberTypes.IS_NUMBER:
-            # NOTE will return True for "NaN", "Inf" and "Infinity".
-            # JS validator accepts only the last one.
-            # It was not tested if these values pass the server-side validation
-            return True
-        arg = self.args[0]
-        if self.subtype is NumberTypes.GT:
-            return val > arg
-        if self.subtype is NumberTypes.GE:
-            return val >= arg
-        if self.subtype is NumberTypes.LT:
-            return val < arg
-        if self.subtype is NumberTypes.LE:
-            return val <= arg
-        if self.subtype is NumberTypes.EQ:
-            # if arg == 2.0, "1.99..9" will pass validation.
-            # It's ok, as long as the value is accepted by server
-            return val == arg
-        if self.subtype is NumberTypes.NE:
-            return val != arg
-        if self.subtype is NumberTypes.RANGE:
-            # The first arg can be greater than the second. This is checked in TextInput.
-            return self.args[0] <= val <= self.args[1]
-        if self.subtype is NumberTypes.NOT_RANGE:
-            # The first arg can be greater than the second, it's ok
-            return val < min(self.args) or val > max(self.args)
-        raise NotImplementedError()
-
-    def _validate_text(self, val):
-        if self.subtype is TextTypes.CONTAINS:
-            return self.args[0] in val
-        if self.subtype is TextTypes.NOT_CONTAINS:
-            return self.args[0] not in val
-        if self.subtype is TextTypes.EMAIL:
-            return EMAIL_REGEX.match(val) is not None
-        if self.subtype is TextTypes.URL:
-            # couldn't find a regex / checking algorithm in page source
-            # It seems that URLS are validaetd on the server side
-            # (client performs only basic checks)
-            return URL_REGEX.match(val) is not None
-        raise NotImplementedError()
 
-    def _validate_length(self, val):
-        if self.subtype is LengthTypes.MIN_LENGTH:
-            return len(val) >= self.args[0]
-        if self.subtype is LengthTypes.MAX_LENGTH:
-            return len(val) <= self.args[0]
-        raise NotImplementedError()
-
-    def _validate_regex(self, val):
-        if self.subtype is RegexTypes.CONTAINS:
-            return self.args[0].search(val) is not None
-        if self.subtype is RegexTypes.NOT_CONTAINS:
-            return self.args[0].search(val) is None
-        if self.subtype is RegexTypes.MATCHES:
-            return self.args[0].match(val) is not None
-        if self.subtype is RegexTypes.NOT_MATCHES:
-            return self.args[0].match(val) is None
-        raise NotImplementedError()
+_text_arg_parsers = {
+    TextValidator.Type.TEXT: _parse_text_args,
+    TextValidator.Type.LENGTH: _parse_length_args,
+    TextValidator.Type.NUMBER: _parse_number_args,
+    TextValidator.Type.REGEX: _parse_regex_args,
+}
 
 
 class GridTypes(Subtype):
@@ -307,6 +333,8 @@ class GridValidator(Validator):
         UNKNOWN = (-1, None)
         DEFAULT = (8, GridTypes)
 
+    __slots__ = ()
+
     @classmethod
     def _parse_arg_list(cls, args, type_, subtype):
         # no args are needed.
@@ -315,13 +343,12 @@ class GridValidator(Validator):
 
     def _validate(self, elem, values: List[List[str]]):
         if self.subtype is GridTypes.EXCLUSIVE_COLUMNS:
-            cnt = Counter()
+            seen = set()
             for row in values:
-                if row:
-                    cnt.update(row)
-                    col, count = max(cnt.items(), key=lambda x: x[1])
-                    if count > 1:
+                for col in row:
+                    if col in seen:
                         raise SameColumn(elem, col)
+                    seen.add(col)
         else:
             raise NotImplementedError()
 
@@ -333,11 +360,21 @@ class CheckboxTypes(Subtype):
     EXACTLY = (204, (1, 'exactly {} option(s)'))
 
 
+# The signature is compare(count, required) -> is_ok
+_checkbox_checks = {
+    CheckboxTypes.AT_LEAST: operator.ge,
+    CheckboxTypes.AT_MOST: operator.le,
+    CheckboxTypes.EXACTLY: operator.eq,
+}
+
+
 class CheckboxValidator(Validator):
     class Type(Validator.Type):
         UNKNOWN = (-1, None)
         DEFAULT = (7, CheckboxTypes)
 
+    __slots__ = ()
+
     @classmethod
     def _parse_arg_list(cls, args, type_, subtype):
         try:
@@ -347,18 +384,12 @@ class CheckboxValidator(Validator):
 
     def _validate(self, elem, values: List[List[str]]):
         required = self.args[0]
-        cnt = len(values[0])
-        if cast('Checkboxes', elem)._other_value is not None:
-            cnt += 1
-        if self.subtype is CheckboxTypes.AT_LEAST:
-            is_ok = cnt >= required
-        elif self.subtype is CheckboxTypes.AT_MOST:
-            is_ok = cnt <= required
-        elif self.subtype is CheckboxTypes.EXACTLY:
-            is_ok = cnt == required
-        else:
+        # elem is a Checkboxes element, count the "Other" value if it is set
+        cnt = len(values[0]) + (elem._other_value is not None)
+        compare = _checkbox_checks.get(self.subtype)
+        if compare is None:
             raise NotImplementedError()
-        if not is_ok:
+        if not compare(cnt, required):
             raise InvalidChoiceCount(elem, cnt)
 
     def _descr(self):
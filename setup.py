@@ -43,6 +43,12 @@ setup(
     extras_require={
         'dev': [
             'pytest',
-        ]
+        ],
+        'orjson': [
+            'orjson',
+        ],
+        'regex': [
+            'regex',
+        ],
     },
 )
@@ -21,11 +21,12 @@ pytestmark = require_urls
 
 
 def parametrize_form_types(form_types: Iterable):
+    form_types = list(form_types)  # categories are iterated lazily
     return pytest.mark.parametrize(
         'form_with_dump, form_type',
-        zip(form_types, form_types),
+        [(form_type, form_type) for form_type in form_types],
         indirect=['form_with_dump'],
-        ids=list(form_types)
+        ids=form_types
     )
 
 
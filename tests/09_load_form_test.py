@@ -2,6 +2,7 @@ import re
 
 import pytest
 
+from gforms import Form
 from gforms.errors import ClosedForm, InvalidURL, NoSuchForm, EditingDisabled, SigninRequired
 
 from .conftest import RealFormTest, require_urls
@@ -51,3 +52,70 @@ class TestShortLoadOk(RealFormTest):
 
     def test_load(self, form):
         pass
+
+
+class TestPageParsing:
+    def test_input_entities(self):
+        page = '<input name="partialResponse" value="[null,&quot;a&amp;b&quot;]">'
+        assert Form._get_input(page, 'partialResponse') == '[null,"a&b"]'
+
+    def test_input_unquoted_uppercase(self):
+        page = "<INPUT TYPE=hidden NAME=fbzx Value=123><input name='pageHistory' value='0,1'>"
+        assert Form._get_input(page, 'fbzx') == '123'
+        assert Form._get_input(page, 'pageHistory') == '0,1'
+
+    def test_input_missing(self):
+        page = '<input name="fbzx"><input name="fbzx" value="123">'
+        assert Form._get_input(page, 'fbzx') is None
+        assert Form._get_input(page, 'pageHistory') is None
+
+    def test_input_attr_with_gt(self):
+        page = '<input data-x="a>b" name="fbzx" value="123">'
+        assert Form._get_input(page, 'fbzx') == '123'
+
+    def test_skipped_inputs(self):
+        page = (
+            '<!-- <input name="fbzx" value="comment"> -->'
+            '<script>var s = \'<input name="fbzx" value="script">\';</script>'
+            '<STYLE>/* <input name="fbzx" value="style"> */</STYLE>'
+            '<input name="fbzx" value="new">'
+        )
+        assert Form._get_input(page, 'fbzx') == 'new'
+
+    def test_form_data(self):
+        page = '<script>FB_PUBLIC_LOAD_DATA_ = [null,["a;b",1]]\n;</script>'
+        assert Form._raw_form(page) == [None, ['a;b', 1]]
+
+    def test_form_data_with_other_js(self):
+        page = '<script>FB_PUBLIC_LOAD_DATA_ = [null,"];"];\nvar x = [1];</script>'
+        assert Form._raw_form(page) == [None, '];']
+
+    def test_form_data_skipped(self):
+        page = (
+            '<!-- <script>FB_PUBLIC_LOAD_DATA_ = [1];</script> -->'
+            '<div>FB_PUBLIC_LOAD_DATA_ = [2];</div>'
+            '<script type="text/javascript">FB_PUBLIC_LOAD_DATA_ = [3];</script>'
+        )
+        assert Form._raw_form(page) == [3]
+
+    def test_form_data_surrogates(self):
+        page = '<script>FB_PUBLIC_LOAD_DATA_ = ["\\ud800"];</script>'
+        assert Form._raw_form(page) == ['\ud800']
+
+    def test_form_data_json(self, monkeypatch):
+        monkeypatch.setattr('gforms.form.orjson', None)
+        page = '<script>FB_PUBLIC_LOAD_DATA_ = [null,18446744073709551616]\n;var x = [1];</script>'
+        assert Form._raw_form(page) == [None, 18446744073709551616]
+
+    def test_scan_page(self):
+        page = (
+            '<input name="fbzx" value="1">'
+            '<script>FB_PUBLIC_LOAD_DATA_ = [1];</script>'
+            '<input name="pageHistory" value="0"><input name="fbzx" value="2">'
+        )
+        names = ('fbzx', 'pageHistory', 'partialResponse')
+        assert Form._scan_page(page, names) == ([1], {'fbzx': '1', 'pageHistory': '0'})
+        assert Form._scan_page(page, names, find_form_data=False)[0] is None
+
+    def test_no_form_data(self):
+        assert Form._raw_form('<script>var x = [1];</script>') is None
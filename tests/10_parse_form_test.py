@@ -1,4 +1,6 @@
+import pickle
 import re
+from types import SimpleNamespace
 from typing import List, Type
 
 import pytest
@@ -13,6 +15,7 @@ from gforms.elements import Date, DateTime, Time, Duration
 from gforms.elements import FileUpload
 from gforms.options import ActionOption, OptionImageAttachment
 from gforms.media import Alignment, ImageObject
+from gforms import validators
 from gforms.validators import GridValidator, TextValidator, GridTypes, CheckboxTypes
 
 from . import fake_urls
@@ -426,8 +429,51 @@ class TestTextValidators(ElementTest):
     def test_regex_args(self, first_page):
         for elem in first_page[17:]:  # pattern
             assert len(elem.validator.args) == 1
-            assert isinstance(elem.validator.args[0], re.Pattern)
-            assert elem.validator.args[0].pattern == 'qw.rt[a-z]'
+            pattern = elem.validator.args[0]
+            assert pattern.pattern == 'qw.rt[a-z]'
+            assert pattern.search('_qwertz_') is not None
+            assert pattern.search('_qwert_') is None
+
+    def test_pickle(self, first_page):
+        for elem in first_page:
+            validator = pickle.loads(pickle.dumps(elem.validator))
+            assert validator.subtype is elem.validator.subtype
+            assert validator.args == elem.validator.args
+
+
+RE_PATTERN = type(re.compile(''))  # re.Pattern is not available in Python 3.6
+
+
+class TestCompileRegex:
+    class FakeRegexError(Exception):
+        pass
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        validators._compile_regex.cache_clear()
+        yield
+        validators._compile_regex.cache_clear()
+
+    def fake_regex(self, compile_):
+        return SimpleNamespace(compile=compile_, error=self.FakeRegexError)
+
+    def test_regex_module(self, monkeypatch):
+        compiled = object()
+        monkeypatch.setattr(validators, 'regex', self.fake_regex(lambda pattern: compiled))
+        assert validators._compile_regex('qw.rt') is compiled
+
+    def test_re_fallback(self, monkeypatch):
+        def compile_(pattern):
+            raise self.FakeRegexError()
+
+        monkeypatch.setattr(validators, 'regex', self.fake_regex(compile_))
+        pattern = validators._compile_regex('qw.rt')
+        assert isinstance(pattern, RE_PATTERN)
+        assert pattern.search('_qwert_') is not None
+
+    def test_no_regex_module(self, monkeypatch):
+        monkeypatch.setattr(validators, 'regex', None)
+        assert isinstance(validators._compile_regex('qw.rt'), RE_PATTERN)
 
 
 class TestGridValidators(ElementTest):
@@ -454,6 +500,11 @@ class TestCheckboxValidators(ElementTest):
             assert validator.args == [2]
             assert validator.error_msg == 'Err_msg'
 
+    def test_pickle(self, first_page):
+        for elem in first_page:
+            validator = pickle.loads(pickle.dumps(elem.validator))
+            assert validator.subtype is elem.validator.subtype
+
 
 class TestShuffleOptions(ElementTest):
     form_type = 'shuffle_options'
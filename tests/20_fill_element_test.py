@@ -8,7 +8,7 @@ import pytest
 from gforms import Form
 from gforms.elements_base import _Action, Element, InputElement, ChoiceInput, ActionChoiceInput, \
     Grid, DateInput, TextInput, ValidatedInput
-from gforms.elements import Value, CheckboxGridValue, ElemValue
+from gforms.elements import Value, CheckboxGridValue, ElemValue, default_callback
 from gforms.elements import Short, Paragraph
 from gforms.elements import Checkboxes, Dropdown, Radio, Scale
 from gforms.elements import CheckboxGrid, RadioGrid
@@ -428,6 +428,13 @@ class ActionChoiceTest(ChoiceTest1D):
 class TestDropdown(ActionChoiceTest):
     elem_type = Dropdown
 
+    def test_default_callback_subclass(self, kwargs):
+        class CustomDropdown(Dropdown):
+            pass
+
+        element = CustomDropdown(required=True, **kwargs)
+        assert default_callback(element, 0, 0) in element.options
+
 
 class TestRadio(MayHaveOther, ActionChoiceTest):
     elem_type = Radio
@@ -708,7 +715,7 @@ class DateTest(SingleEntryTest):
 class TestDateTime(DateTest):
     elem_type = DateTime
 
-    @pytest.mark.parametrize('with_year', [True, False], indirect=True)
+    @pytest.mark.parametrize('with_year', [True, False], indirect=True, ids=['with_year', 'no_year'])
     def test_datetime(self, with_year, element):
         value = datetime(2000, 12, 31, 12, 34, 56)
         payload = self.get_payload(element, value)
@@ -724,7 +731,7 @@ class TestDateTime(DateTest):
 class TestDate(DateTest):
     elem_type = Date
 
-    @pytest.mark.parametrize('with_year', [True, False], indirect=True)
+    @pytest.mark.parametrize('with_year', [True, False], indirect=True, ids=['with_year', 'no_year'])
     def test_date(self, with_year, element):
         value = date(2000, 12, 31)
         payload = self.get_payload(element, value)
@@ -758,7 +765,8 @@ class TestDuration(SingleEntryTest):
         assert self.extract_value(payload, part='second') == s
         assert payload == {}
 
-    @pytest.mark.parametrize('duration', [timedelta(seconds=73*3600), timedelta(seconds=-1)])
+    @pytest.mark.parametrize('duration', [timedelta(seconds=73*3600), timedelta(seconds=-1)],
+                             ids=['too_long', 'negative'])
     def test_invalid_duration(self, element, duration):
         element.set_value(duration)
         with pytest.raises(InvalidDuration):
@@ -1,13 +1,16 @@
 from datetime import timedelta, time, datetime, date
 
 import pytest
+import requests
 
 from gforms import Form
+from gforms.form import Settings
 from gforms.elements_base import Grid
 from gforms.elements import DateTime, Duration, Date, Time
 from gforms.errors import FormNotLoaded, FormNotValidated
 
-from .conftest import FormDumpTest
+from . import fake_urls
+from .conftest import FormDumpTest, generate_html
 
 
 class TestFormMethods(FormDumpTest):
@@ -176,3 +179,65 @@ class TestMultipageValidation(FormDumpTest):
         # Skipped page invalidation should not affect form status
         radio2.set_value('Opt2')
         assert form.is_validated
+
+
+class TestDefaultSession(FormDumpTest):
+    """load() and submit() create (and close) a session if it is not provided."""
+
+    form_type = 'form_validation'
+
+    class FakeSession(requests.Session):
+        def __init__(self, sessions):
+            super().__init__()
+            self.closed = False
+            sessions.append(self)
+
+        def get(self, url, **kwargs):
+            resp = requests.models.Response()
+            resp.url = url
+            resp._content = generate_html(url).encode()
+            return resp
+
+        def close(self):
+            self.closed = True
+            super().close()
+
+    @pytest.fixture
+    def sessions(self, monkeypatch):
+        sessions = []
+        monkeypatch.setattr('gforms.form.requests.Session', lambda: self.FakeSession(sessions))
+        return sessions
+
+    def test_load(self, sessions):
+        form = Form()
+        form.load(getattr(fake_urls.FormUrl, self.form_type))
+        assert form.is_loaded
+        assert len(form.pages) == 2
+        assert len(sessions) == 1
+        assert sessions[0].closed
+
+    def test_submit(self, mutable_form, sessions, monkeypatch):
+        form = mutable_form
+        form.settings.send_receipt = Settings.SendReceipt.OPT_IN
+        form.validate()
+        submit = Form.submit
+        calls = []
+
+        def fake_submit(self, session=None, **kwargs):
+            if session is None:
+                return submit(self, **kwargs)
+            calls.append((session, kwargs))
+            return 'result'
+
+        def captcha_handler(_):
+            return 'captcha'
+
+        monkeypatch.setattr(Form, 'submit', fake_submit)
+        result = form.submit(need_receipt=True, captcha_handler=captcha_handler, emulate_history=True)
+        assert result == 'result'
+        assert calls == [(sessions[0], {
+            'need_receipt': True,
+            'captcha_handler': captcha_handler,
+            'emulate_history': True,
+        })]
+        assert sessions[0].closed